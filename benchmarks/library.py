@@ -0,0 +1,277 @@
+import random
+import struct
+import os
+
+REDIST_FILES = [
+    ("_CommonRedist/vcredist/2019", "VC_redist.x64.exe", "Microsoft Visual C++ 2015-2019 Redistributable (x64)"),
+    ("_CommonRedist/vcredist/2019", "VC_redist.x86.exe", "Microsoft Visual C++ 2015-2019 Redistributable (x86)"),
+    ("_CommonRedist/DirectX/Jun2010", "DXSETUP.exe", "DirectX Setup"),
+    ("_CommonRedist/DotNet/4.8", "ndp48-x86-x64-allos-enu.exe", "Microsoft .NET Framework 4.8 Setup"),
+    ("Engine/Extras/Redist/en-us", "UEPrereqSetup_x64.exe", "Unreal Engine Prerequisites"),
+    ("EasyAntiCheat", "EasyAntiCheat_Setup.exe", "EasyAntiCheat Setup"),
+    ("", "unins000.exe", "Setup/Uninstall"),
+]
+
+WORDS = [
+    "Shadow", "Iron", "Crimson", "Star", "Last", "Lost", "Eternal", "Hollow", "Neon", "Frozen",
+    "Kingdom", "Legends", "Odyssey", "Frontier", "Protocol", "Horizon", "Dungeon", "Empire", "Drift", "Saga",
+]
+
+SUBDIRS = ["bin", "Binaries", "Win64", "x64", "Game", "Data", "Tools", "Launcher", "Support"]
+
+EXE_SUFFIXES = ["", "_x64", "Launcher", "Config", "Editor", "CrashReporter", "Server"]
+
+
+def _utf16z(text):
+    return text.encode("utf-16-le") + b"\x00\x00"
+
+
+def _pad4(data):
+    return data + b"\x00" * (-len(data) % 4)
+
+
+def _version_block(key, value=b"", value_length=0, is_text=False, children=()):
+    """
+    Builds a single VS_VERSIONINFO style block (VS_VERSIONINFO, StringFileInfo, StringTable, String, VarFileInfo or Var).
+
+    Args:
+        key (str): The szKey of the block.
+        value (bytes): The raw value of the block.
+        value_length (int): The wValueLength of the block, in WORDs for text values and bytes otherwise.
+        is_text (bool): Whether the value is text (wType 1) or binary (wType 0).
+        children (iterable): Already built child blocks.
+
+    Returns:
+        bytes: The encoded block, without trailing padding.
+    """
+    # Padding is relative to the start of the block, which begins with the 6 byte header
+    block = _pad4(b"\x00" * 6 + _utf16z(key)) + value
+    if children:
+        block = _pad4(block) + b"".join(_pad4(child) for child in children)
+    return struct.pack("<HHH", len(block), value_length, 1 if is_text else 0) + block[6:]
+
+
+def build_version_info(description, version=(1, 0, 0, 0), product_name=None):
+    """
+    Builds a VS_VERSIONINFO resource with an en-US / Unicode (040904b0) string table.
+
+    Args:
+        description (str): The FileDescription string.
+        version (tuple): The file and product version as four integers.
+        product_name (str): The ProductName string, defaults to the description.
+
+    Returns:
+        bytes: The encoded VS_VERSIONINFO resource.
+    """
+    ms = (version[0] << 16) | version[1]
+    ls = (version[2] << 16) | version[3]
+    fixed_file_info = struct.pack(
+        "<13I",
+        0xFEEF04BD,  # dwSignature
+        0x00010000,  # dwStrucVersion
+        ms, ls,      # dwFileVersionMS/LS
+        ms, ls,      # dwProductVersionMS/LS
+        0x3F,        # dwFileFlagsMask
+        0,           # dwFileFlags
+        0x00040004,  # dwFileOS: VOS_NT_WINDOWS32
+        0x1,         # dwFileType: VFT_APP
+        0,           # dwFileSubtype
+        0, 0,        # dwFileDateMS/LS
+    )
+
+    version_text = ".".join(str(part) for part in version)
+    strings = [
+        ("FileDescription", description),
+        ("FileVersion", version_text),
+        ("ProductName", product_name or description),
+        ("ProductVersion", version_text),
+    ]
+    string_blocks = [
+        _version_block(name, _utf16z(text), len(text) + 1, is_text=True)
+        for name, text in strings
+    ]
+
+    string_table = _version_block("040904b0", is_text=True, children=string_blocks)
+    string_file_info = _version_block("StringFileInfo", is_text=True, children=[string_table])
+    translation = _version_block("Translation", struct.pack("<HH", 0x0409, 0x04B0), 4)
+    var_file_info = _version_block("VarFileInfo", is_text=True, children=[translation])
+
+    return _version_block("VS_VERSION_INFO", fixed_file_info, len(fixed_file_info),
+                          children=[string_file_info, var_file_info])
+
+
+def build_pe(description, version=(1, 0, 0, 0), product_name=None):
+    """
+    Builds a tiny but valid 32-bit PE image whose only section is a .rsrc section holding a version resource.
+
+    The image has no code, it is only meant to be read by GetFileVersionInfo, never executed.
+
+    Args:
+        description (str): The FileDescription of the executable.
+        version (tuple): The file and product version as four integers.
+        product_name (str): The ProductName of the executable, defaults to the description.
+
+    Returns:
+        bytes: The contents of the .exe file.
+    """
+    file_alignment = 0x200
+    section_alignment = 0x1000
+    rsrc_rva = 0x1000
+
+    version_info = build_version_info(description, version, product_name)
+
+    # Resource tree: RT_VERSION (16) -> ID 1 -> LANG 0x0409 -> data entry -> VS_VERSIONINFO
+    def directory(entry_id, offset):
+        return struct.pack("<IIHHHH", 0, 0, 0, 0, 0, 1) + struct.pack("<II", entry_id, offset)
+
+    data_offset = 88
+    rsrc = (
+        directory(16, 0x80000000 | 24)
+        + directory(1, 0x80000000 | 48)
+        + directory(0x0409, 72)
+        + struct.pack("<IIII", rsrc_rva + data_offset, len(version_info), 0, 0)
+        + version_info
+    )
+    virtual_size = len(rsrc)
+    rsrc += b"\x00" * (-len(rsrc) % file_alignment)
+    size_of_image = rsrc_rva + virtual_size + (-virtual_size % section_alignment)
+
+    dos_header = b"MZ" + b"\x00" * 58 + struct.pack("<I", 0x40)
+    coff_header = struct.pack(
+        "<HHIIIHH",
+        0x014C,  # Machine: i386
+        1,       # NumberOfSections
+        0, 0, 0,
+        0xE0,    # SizeOfOptionalHeader
+        0x0102,  # Characteristics: EXECUTABLE_IMAGE | 32BIT_MACHINE
+    )
+    data_directories = [(0, 0)] * 16
+    data_directories[2] = (rsrc_rva, virtual_size)
+    optional_header = struct.pack(
+        "<HBBIIIIIIIIIHHHHHHIIIIHHIIIIII",
+        0x010B,               # Magic: PE32
+        0, 0,                 # Linker version
+        0,                    # SizeOfCode
+        len(rsrc),            # SizeOfInitializedData
+        0,                    # SizeOfUninitializedData
+        0,                    # AddressOfEntryPoint
+        rsrc_rva, rsrc_rva,   # BaseOfCode, BaseOfData
+        0x00400000,           # ImageBase
+        section_alignment,
+        file_alignment,
+        4, 0, 0, 0, 4, 0,     # OS, image and subsystem versions
+        0,                    # Win32VersionValue
+        size_of_image,
+        file_alignment,       # SizeOfHeaders
+        0,                    # CheckSum
+        2,                    # Subsystem: WINDOWS_GUI
+        0,                    # DllCharacteristics
+        0x100000, 0x1000,     # SizeOfStackReserve/Commit
+        0x100000, 0x1000,     # SizeOfHeapReserve/Commit
+        0,                    # LoaderFlags
+        16,                   # NumberOfRvaAndSizes
+    ) + b"".join(struct.pack("<II", rva, size) for rva, size in data_directories)
+    section_header = struct.pack(
+        "<8sIIIIIIHHI",
+        b".rsrc",
+        virtual_size,
+        rsrc_rva,
+        len(rsrc),
+        file_alignment,  # PointerToRawData
+        0, 0, 0, 0,
+        0x40000040,      # INITIALIZED_DATA | MEM_READ
+    )
+
+    headers = dos_header + b"PE\x00\x00" + coff_header + optional_header + section_header
+    headers += b"\x00" * (file_alignment - len(headers))
+
+    return headers + rsrc
+
+
+def generate_library(root_path, dirs=50, depth=2, exes_per_dir=2, redist_ratio=0.5, seed=0):
+    """
+    Generates a synthetic game install tree for benchmarking.
+
+    Each game gets its own top-level folder containing a chain of `depth` nested subfolders. Every folder
+    in the chain holds `exes_per_dir` executables with version resources, the first one in the top-level
+    folder being the game itself. A `redist_ratio` share of the games additionally ship redistributables,
+    anti-cheat installers and an uninstaller, which the detection is expected to ignore.
+
+    The same arguments always produce the same tree. The folder must not exist or be empty, so the
+    summary always describes the whole tree.
+
+    Args:
+        root_path (str): The folder to generate the library in.
+        dirs (int): The number of game folders, at least 0.
+        depth (int): The number of nested subfolders below each game folder, at least 0.
+        exes_per_dir (int): The number of executables in each folder, at least 1 so every game has its executable.
+        redist_ratio (float): The share of games that ship redistributable noise, between 0 and 1.
+        seed (int): The seed of the random generator.
+
+    Returns:
+        dict: A summary of the tree with the "games" (list of {"name", "path"} for each game's main executable),
+        the total number of "directories", "files" and "exes" and the total size in "bytes".
+
+    Raises:
+        ValueError: If an argument is out of range or the folder already has content.
+    """
+    if dirs < 0:
+        raise ValueError("dirs must not be negative.")
+    if depth < 0:
+        raise ValueError("depth must not be negative.")
+    if exes_per_dir < 1:
+        raise ValueError("exes_per_dir must be at least 1.")
+    if not 0 <= redist_ratio <= 1:
+        raise ValueError("redist_ratio must be between 0 and 1.")
+    if os.path.isdir(root_path) and os.listdir(root_path):
+        raise ValueError(f"The library folder {root_path} is not empty.")
+
+    rng = random.Random(seed)
+    pe_cache = {}
+    games = []
+
+    def write_file(path, data):
+        with open(path, "wb") as file:
+            file.write(data)
+
+    def write_exe(path, description):
+        if description not in pe_cache:
+            pe_cache[description] = build_pe(description, (1, rng.randint(0, 9), rng.randint(0, 99), 0))
+        write_file(path, pe_cache[description])
+
+    os.makedirs(root_path, exist_ok=True)
+
+    for index in range(dirs):
+        name = f"{rng.choice(WORDS)} {rng.choice(WORDS)} {index + 1}"
+        stem = name.replace(" ", "")
+        game_dir = os.path.join(root_path, name)
+
+        folder = game_dir
+        for level in range(depth + 1):
+            os.makedirs(folder, exist_ok=True)
+            for exe_index in range(exes_per_dir):
+                if level == 0 and exe_index == 0:
+                    exe_name, description = f"{stem}.exe", name
+                else:
+                    suffix = rng.choice(EXE_SUFFIXES[1:])
+                    exe_name, description = f"{stem}{suffix}_{level}_{exe_index}.exe", f"{name} {suffix}"
+                write_exe(os.path.join(folder, exe_name), description)
+            write_file(os.path.join(folder, f"data{level}.pak"), rng.randbytes(256))
+            folder = os.path.join(folder, rng.choice(SUBDIRS))
+
+        games.append({"name": name, "path": os.path.join(game_dir, f"{stem}.exe")})
+
+        if rng.random() < redist_ratio:
+            for subdir, exe_name, description in REDIST_FILES:
+                redist_dir = os.path.join(game_dir, *subdir.split("/"))
+                os.makedirs(redist_dir, exist_ok=True)
+                write_exe(os.path.join(redist_dir, exe_name), description)
+
+    summary = {"games": games, "directories": 0, "files": 0, "exes": 0, "bytes": 0}
+    for dirpath, _, filenames in os.walk(root_path):
+        summary["directories"] += 1
+        summary["files"] += len(filenames)
+        summary["exes"] += sum(1 for file in filenames if file.endswith('.exe'))
+        summary["bytes"] += sum(os.path.getsize(os.path.join(dirpath, file)) for file in filenames)
+
+    return summary
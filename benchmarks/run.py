@@ -0,0 +1,404 @@
+import argparse
+import platform
+import statistics
+import tracemalloc
+import tempfile
+import shutil
+import time
+import json
+import os
+from unittest.mock import patch
+
+import win32process
+
+import main
+from benchmarks.library import generate_library
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content
+
+
+class FakeLLM:
+    """
+    Stands in for ChatCohere / ChatOpenAI so detection can be benchmarked offline.
+
+    Every call sleeps for `latency` seconds and answers with the given games, formatted the way the
+    real models usually answer (inside a ```json fence). The messages of each call are kept so the
+    prompt size can be measured.
+    """
+    def __init__(self, games, latency=0.0):
+        self.games = games
+        self.latency = latency
+        self.calls = []
+
+    def __call__(self, **kwargs):
+        return self
+
+    def invoke(self, messages):
+        self.calls.append(messages)
+        time.sleep(self.latency)
+        return FakeResponse("```json\n" + json.dumps(self.games, indent=4) + "\n```")
+
+
+class StageError(Exception):
+    """Raised in place of the error dialogs of the app, so a failing stage stops the benchmark."""
+
+
+def raise_stage_error(title, message, **kwargs):
+    raise StageError(f"{title}: {message}")
+
+
+def count_tokens(text):
+    """
+    Counts the tokens of a prompt with the gpt-4o-mini tokenizer if tiktoken is available, matching the
+    OpenAI path of getGameStandalonesFromLLM that the benchmark runs.
+
+    Args:
+        text (str): The prompt text.
+
+    Returns:
+        tuple: The number of tokens and the name of the tokenizer used, or an estimate of one token
+        per four characters and "chars/4" if tiktoken is unavailable.
+    """
+    try:
+        import tiktoken
+        encoding = tiktoken.encoding_for_model("gpt-4o-mini")
+        return len(encoding.encode(text)), encoding.name
+    except Exception:
+        return len(text) // 4, "chars/4"
+
+
+def peak_rss():
+    """
+    Gets the peak working set (peak RSS) of the current process.
+
+    Returns:
+        int: The peak working set in bytes.
+    """
+    return win32process.GetProcessMemoryInfo(main.win32api.GetCurrentProcess())["PeakWorkingSetSize"]
+
+
+def run_stage(func, files, repeat, measure_alloc=True):
+    """
+    Runs a benchmark stage several times and summarizes it.
+
+    The stage is timed over `repeat` runs. Unless `measure_alloc` is False, it is then run once more under
+    tracemalloc to measure the peak memory it allocates, so tracing does not slow down the timed runs.
+
+    Args:
+        func (callable): The stage to run, called without arguments.
+        files (int or callable): The number of files the stage processes per run, or a function that
+            gets it from the return value of the stage.
+        repeat (int): The number of timed runs.
+        measure_alloc (bool): Whether to measure the peak allocated memory in an extra run.
+
+    Returns:
+        tuple: The stage summary (dict) and the return value of the last run.
+    """
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        runs.append(time.perf_counter() - start)
+
+    # Read before the traced run, whose allocation records would raise the process peak
+    cumulative_peak_rss = peak_rss()
+
+    peak_alloc = None
+    if measure_alloc:
+        tracemalloc.start()
+        try:
+            result = func()
+            _, peak_alloc = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    if callable(files):
+        files = files(result)
+
+    wall = statistics.median(runs)
+    return {
+        "wall_s": wall,
+        "runs_s": runs,
+        "files": files,
+        "files_per_s": files / wall if wall else None,
+        "peak_alloc_bytes": peak_alloc,
+        "cumulative_peak_rss_bytes": cumulative_peak_rss,
+    }, result
+
+
+def run_benchmarks(library_path, dirs, depth, exes_per_dir, redist_ratio, seed, llm_latency, repeat):
+    """
+    Generates a synthetic library and benchmarks the scanning, detection and game list stages on it.
+
+    The stages run in this order: generate, get_file_description, getStandalone, getGameStandalonesFromLLM,
+    update_game_treeview, save_games and load_games. load_games includes the treeview refresh it triggers.
+    The Tk stages are skipped when no display is available. The library is generated once, so the
+    generate stage has no "peak_alloc_bytes".
+
+    The benchmark runs in a temporary working directory, so games.pkl and error-logs.txt never land in
+    the project directory. While it runs, the error dialogs of the app raise a StageError instead of
+    blocking and the OpenAI path of the detection is served by a FakeLLM; both are restored afterwards.
+
+    Each stage reports "peak_alloc_bytes", the peak memory allocated by Python while the stage runs, and
+    "cumulative_peak_rss_bytes", the peak working set of the whole process since it started, read at the
+    end of the timed runs. The latter can only grow from one stage to the next.
+
+    Args:
+        library_path (str): The folder to generate the library in, it must not exist or be empty.
+        dirs (int): The number of game folders.
+        depth (int): The number of nested subfolders below each game folder.
+        exes_per_dir (int): The number of executables in each folder.
+        redist_ratio (float): The share of games that ship redistributable noise.
+        seed (int): The seed of the library generator.
+        llm_latency (float): The latency of the fake LLM, in seconds.
+        repeat (int): The number of timed runs of each stage.
+
+    Returns:
+        dict: The machine-readable report.
+
+    Raises:
+        ValueError: If an argument is out of range or the library folder is not empty.
+        StageError: If a stage fails.
+    """
+    if repeat < 1:
+        raise ValueError("repeat must be at least 1.")
+    if llm_latency < 0:
+        raise ValueError("llm_latency must not be negative.")
+
+    fake_llm = FakeLLM([], llm_latency)
+    stages = {}
+    root = None
+    cwd = os.getcwd()
+    data_dir = tempfile.mkdtemp(prefix="game-launcher-data-")
+    os.chdir(data_dir)
+    try:
+        with patch.object(main.messagebox, "showerror", raise_stage_error), \
+                patch.object(main, "ChatCohere", fake_llm), \
+                patch.object(main, "ChatOpenAI", fake_llm), \
+                patch.dict(os.environ, {"LLM_CHOICE": "OpenAI", "OPENAI_API_KEY": "benchmark"}):
+            stages["generate"], summary = run_stage(
+                lambda: generate_library(library_path, dirs, depth, exes_per_dir, redist_ratio, seed),
+                lambda summary: summary["files"], 1, measure_alloc=False)
+
+            exe_paths = [os.path.join(dirpath, file)
+                         for dirpath, _, filenames in os.walk(library_path)
+                         for file in filenames if file.endswith('.exe')]
+
+            stages["get_file_description"], _ = run_stage(
+                lambda: [main.get_file_description(path) for path in exe_paths], len(exe_paths), repeat)
+
+            stages["getStandalone"], exe_data = run_stage(
+                lambda: main.getStandalone(library_path), summary["files"], repeat)
+
+            fake_llm.games = summary["games"]
+            files_in_prompt = sum(len(exes) for exes in exe_data.values())
+            stages["getGameStandalonesFromLLM"], detected_games = run_stage(
+                lambda: main.getGameStandalonesFromLLM(exe_data), files_in_prompt, repeat)
+            if len(detected_games) != len(summary["games"]):
+                raise StageError(f"The fake LLM returned {len(detected_games)} games instead of {len(summary['games'])}.")
+
+            system_message, human_message = fake_llm.calls[-1]
+            prompt = system_message.content + human_message.content
+            prompt_tokens, tokenizer = count_tokens(prompt)
+            stages["getGameStandalonesFromLLM"].update({
+                "llm_choice": "OpenAI",
+                "llm_latency_s": llm_latency,
+                "prompt_chars": len(prompt),
+                "prompt_tokens": prompt_tokens,
+                "tokenizer": tokenizer,
+            })
+
+            launcher = main.GameLauncher.__new__(main.GameLauncher)
+            launcher.games = [os.path.normpath(game["path"]) for game in detected_games]
+
+            try:
+                root = main.tk.Tk()
+                root.withdraw()
+                launcher.game_treeview = main.ttk.Treeview(root, show="tree", selectmode="browse")
+            except main.tk.TclError as e:
+                root = None
+                skipped = {"skipped": str(e)}
+
+            if root:
+                stages["update_game_treeview"], _ = run_stage(
+                    launcher.update_game_treeview, len(launcher.games), repeat)
+            else:
+                stages["update_game_treeview"] = skipped
+
+            stages["save_games"], _ = run_stage(launcher.save_games, len(launcher.games), repeat)
+
+            if root:
+                stages["load_games"], _ = run_stage(launcher.load_games, len(launcher.games), repeat)
+            else:
+                stages["load_games"] = dict(skipped)
+    finally:
+        os.chdir(cwd)
+        if root:
+            root.destroy()
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+    return {
+        "platform": {
+            "system": platform.platform(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+        },
+        "parameters": {
+            "dirs": dirs,
+            "depth": depth,
+            "exes_per_dir": exes_per_dir,
+            "redist_ratio": redist_ratio,
+            "seed": seed,
+            "llm_latency_s": llm_latency,
+            "repeat": repeat,
+        },
+        "library": {key: value for key, value in summary.items() if key != "games"},
+        "stages": stages,
+    }
+
+
+def parameter_differences(baseline_parameters, parameters):
+    """
+    Lists the benchmark parameters that differ between two runs.
+
+    `repeat` is left out, the number of timed runs does not change the workload.
+
+    Args:
+        baseline_parameters (dict): The parameters of the report to compare against.
+        parameters (dict): The parameters of the new run.
+
+    Returns:
+        list: The names of the parameters that differ, sorted.
+    """
+    keys = (set(baseline_parameters) | set(parameters)) - {"repeat"}
+    return sorted(key for key in keys if baseline_parameters.get(key) != parameters.get(key))
+
+
+def compare_reports(baseline, current):
+    """
+    Compares two reports made with the same parameters.
+
+    Args:
+        baseline (dict): The report to compare against.
+        current (dict): The new report.
+
+    Returns:
+        dict: For each stage present in both reports, the baseline and current wall time, their ratio
+        (above 1 means the current run is slower) and the change of the peak allocated memory and peak RSS.
+        The LLM stage also gets the change of the prompt size in characters and, when both reports were
+        counted with the same tokenizer, in tokens; otherwise a "warning" names both tokenizers.
+
+    Raises:
+        ValueError: If the parameters of the reports differ.
+    """
+    differences = parameter_differences(baseline["parameters"], current["parameters"])
+    if differences:
+        raise ValueError(f"The reports were made with different parameters: {', '.join(differences)}.")
+
+    comparison = {}
+    for stage, result in current["stages"].items():
+        base = baseline["stages"].get(stage, {})
+        if "wall_s" not in result or not base.get("wall_s"):
+            continue
+
+        stage_comparison = {
+            "baseline_wall_s": base["wall_s"],
+            "wall_s": result["wall_s"],
+            "ratio": result["wall_s"] / base["wall_s"],
+        }
+        for key in ("peak_alloc_bytes", "cumulative_peak_rss_bytes", "prompt_chars"):
+            if result.get(key) is not None and base.get(key) is not None:
+                stage_comparison[f"{key}_delta"] = result[key] - base[key]
+
+        if "prompt_tokens" in result and "prompt_tokens" in base:
+            if result["tokenizer"] == base["tokenizer"]:
+                stage_comparison["prompt_tokens_delta"] = result["prompt_tokens"] - base["prompt_tokens"]
+            else:
+                stage_comparison["warning"] = (f"Prompt tokens not compared, counted with {base['tokenizer']} "
+                                               f"and {result['tokenizer']}.")
+
+        comparison[stage] = stage_comparison
+    return comparison
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
+    return number
+
+
+def non_negative_int(value):
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"{value} is not a non-negative integer")
+    return number
+
+
+def non_negative_float(value):
+    number = float(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"{value} is not a non-negative number")
+    return number
+
+
+def ratio(value):
+    number = float(value)
+    if not 0 <= number <= 1:
+        raise argparse.ArgumentTypeError(f"{value} is not between 0 and 1")
+    return number
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark Game Launcher on a synthetic game library (Windows only).")
+    parser.add_argument("--dirs", type=non_negative_int, default=50, help="number of game folders")
+    parser.add_argument("--depth", type=non_negative_int, default=2, help="nested subfolders below each game folder")
+    parser.add_argument("--exes-per-dir", type=positive_int, default=2, help="executables in each folder")
+    parser.add_argument("--redist-ratio", type=ratio, default=0.5, help="share of games shipping redistributables")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the library generator")
+    parser.add_argument("--llm-latency", type=non_negative_float, default=0.0, help="latency of the fake LLM in seconds")
+    parser.add_argument("--repeat", type=positive_int, default=3, help="timed runs of each stage, the median is reported")
+    parser.add_argument("--library", help="empty folder to generate the library in (kept), defaults to a temporary folder")
+    parser.add_argument("--output", help="file to write the JSON report to, defaults to stdout")
+    parser.add_argument("--compare", help="previous JSON report, made with the same parameters, to compare against")
+    args = parser.parse_args()
+
+    if args.library and os.path.isdir(args.library) and os.listdir(args.library):
+        parser.error(f"--library folder {args.library} is not empty")
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+        differences = parameter_differences(baseline["parameters"], {
+            "dirs": args.dirs,
+            "depth": args.depth,
+            "exes_per_dir": args.exes_per_dir,
+            "redist_ratio": args.redist_ratio,
+            "seed": args.seed,
+            "llm_latency_s": args.llm_latency,
+            "repeat": args.repeat,
+        })
+        if differences:
+            parser.error(f"--compare report was made with different parameters: {', '.join(differences)}")
+
+    library_path = os.path.abspath(args.library or tempfile.mkdtemp(prefix="game-launcher-library-"))
+    try:
+        report = run_benchmarks(library_path, args.dirs, args.depth, args.exes_per_dir,
+                                args.redist_ratio, args.seed, args.llm_latency, args.repeat)
+    finally:
+        if not args.library:
+            shutil.rmtree(library_path, ignore_errors=True)
+
+    if baseline:
+        report["comparison"] = compare_reports(baseline, report)
+
+    output = json.dumps(report, indent=4)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output)
+    else:
+        print(output)